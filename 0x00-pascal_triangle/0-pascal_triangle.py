@@ -1,5 +1,32 @@
 #!/usr/bin/python3
 """Script that generate pascal's triangle for any number"""
+from array import array
+from functools import lru_cache
+
+
+def pascal_row(i, row=None):
+    """
+    returns row i of the Pascal's triangle, computed on its own with
+    C(i, j+1) = C(i, j) * (i-j) // (j+1)
+    row, when given, is a sequence of i+1 ones to fill in place
+    """
+    if row is None:
+        row = [1] * (i+1)
+    c = 1
+    # the row is symmetric, so only the first half needs computing
+    for j in range(i // 2):
+        c = c * (i-j) // (j+1)
+        row[j+1] = row[i-j-1] = c
+    return row
+
+
+@lru_cache(maxsize=None)
+def _row(i):
+    """
+    returns row i of the Pascal's triangle as a tuple, computed once and
+    shared by every later call
+    """
+    return tuple(pascal_row(i))
 
 
 def pascal_triangle(n):
@@ -12,13 +39,15 @@ def pascal_triangle(n):
     if n <= 0:
         return triangle
     for i in range(n):
-        row = []
-
-        for j in range(i+1):
-            if j == 0 or j == i:
-                row.append(1)
-            else:
-                row.append(triangle[i-1][j-1] + triangle[i-1][j])
-        triangle.append(row)
+        triangle.append(list(_row(i)))
     # print(triangle)
     return triangle
+
+
+def pascal_triangle_compact(n):
+    """
+    returns the Pascal's triangle of n with each row stored as a compact
+    array of signed 64-bit integers instead of a list of int objects;
+    raises OverflowError for n > 67, as row 67 no longer fits in 64 bits
+    """
+    return [pascal_row(i, array('q', [1]) * (i+1)) for i in range(n)]
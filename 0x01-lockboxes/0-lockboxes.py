@@ -9,18 +9,24 @@ There can be keys that do not have boxes
 The first box boxes[0] is unlocked
 Return True if all boxes can be opened, else return False
 """
+from collections import deque
 
 
 def canUnlockAll(boxes):
     """Return True if all boxes can be opened, else return False"""
     n = len(boxes)
-    unlocked = set([0])  # Start with box 0 unlocked
-    keys = set(boxes[0])  # Keys from the first box
+    unlocked = bytearray(n)  # one flag per box
+    unlocked[0] = 1  # Start with box 0 unlocked
+    count = 1
+    keys = deque(boxes[0])  # Keys from the first box
 
     while keys:
-        new_key = keys.pop()
-        if new_key < n and new_key not in unlocked:
-            unlocked.add(new_key)
-            keys.update(boxes[new_key])
+        new_key = keys.popleft()
+        if 0 <= new_key < n and not unlocked[new_key]:
+            unlocked[new_key] = 1
+            count += 1
+            if count == n:
+                return True  # every box is open, no need to drain keys
+            keys.extend(boxes[new_key])
 
-    return len(unlocked) == n
+    return count == n
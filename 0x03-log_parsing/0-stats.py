@@ -10,7 +10,7 @@ Input Format:
 Example: 127.0.0.1 - [2024-01-01] "GET /projects/260 HTTP/1.1" 200 2000
 
 Features:
-    - Processes log entries line by line from stdin
+    - Reads stdin in large blocks and processes the log entries line by line
     - Computes total file size
     - Tracks frequency of valid HTTP status codes
     - Prints statistics every 10 lines and on CTRL+C
@@ -28,48 +28,110 @@ Usage:
 """
 
 
+import atexit
 import sys
 
-# store the count of all status codes in a dictionary
-status_codes_dict = {'200': 0, '301': 0, '400': 0, '401': 0, '403': 0,
-                     '404': 0, '405': 0, '500': 0}
 
-total_size = 0
-count = 0  # keep count of the number lines counted
-
-try:
-    for line in sys.stdin:
-        line_list = line.split(" ")
-
-        if len(line_list) > 4:
-            status_code = line_list[-2]
-            file_size = int(line_list[-1])
-
-            # check if the status code receive exists in the dictionary and
+def read_lines(stream, size=1 << 16):
+    """
+    Reads a binary stream in blocks of at most size bytes and yields the
+    complete lines of each block as a list of bytes; a partial last line
+    is carried over to the next block
+    """
+    pending = []  # pieces of the partial line, joined once it is complete
+    while True:
+        # read1 returns whatever is available, so live input is not held back
+        chunk = stream.read1(size)
+        if not chunk:
+            break
+        if b'\n' not in chunk:
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(chunk)
+            chunk = b''.join(pending)
+        lines = chunk.split(b'\n')
+        tail = lines.pop()
+        pending = [tail] if tail else []
+        yield lines
+    if pending:
+        yield [b''.join(pending)]
+
+
+# request every valid log entry contains
+REQUEST = b'"GET /projects/260 HTTP/1.1"'
+
+# valid status codes, in the order they are printed
+STATUS_CODES = (b'200', b'301', b'400', b'401', b'403', b'404', b'405', b'500')
+
+# position of each status code's count in the counts list
+CODE_INDEX = {code: i for i, code in enumerate(STATUS_CODES)}
+
+
+def print_stats(total_size, counts):
+    """Prints the total file size and the non-zero status code counts"""
+    out = ['File size: {}'.format(total_size)]
+    for key, value in zip(STATUS_CODES, counts):
+        if value != 0:
+            out.append('{}: {}'.format(key.decode(), value))
+    sys.stdout.write('\n'.join(out) + '\n')
+
+
+def run(stream, counts, total):
+    """
+    Processes the log entries read from stream, adding each status code
+    to its CODE_INDEX position in counts and each file size to total, a
+    one-slot list, so the caller can still report them if the loop ends
+    early
+    """
+    count = 0  # keep count of the number lines counted
+
+    # bind the globals and methods used on every line to local names
+    request = REQUEST
+    code_index = CODE_INDEX.get
+
+    for lines in read_lines(stream):
+        for line in lines:
+            # cheap substring test to skip lines that cannot match
+            if request not in line:
+                continue
+
+            # slice out the last two fields without splitting the line
+            end = line.rstrip()
+            p2 = end.rfind(b' ')
+            p1 = end.rfind(b' ', 0, p2)
+            status_code = end[p1 + 1:p2]
+            file_size = end[p2 + 1:]
+
+            # skip malformed lines instead of aborting the whole loop
+            if not file_size.isdigit():
+                continue
+
+            # check if the status code receive is valid and
             # increment its count
-            if status_code in status_codes_dict.keys():
-                status_codes_dict[status_code] += 1
+            idx = code_index(status_code)
+            if idx is not None:
+                counts[idx] += 1
 
             # update total size
-            total_size += file_size
+            total[0] += int(file_size)
 
             # update count of lines
             count += 1
 
-        if count == 10:
-            count = 0  # reset count
-            print('File size: {}'.format(total_size))
+            if count == 10:
+                count = 0  # reset count
+                print_stats(total[0], counts)
 
-            # print out status code counts
-            for key, value in sorted(status_codes_dict.items()):
-                if value != 0:
-                    print('{}: {}'.format(key, value))
 
-except Exception as err:
-    pass
+if __name__ == '__main__':
+    counts = [0] * len(STATUS_CODES)
+    total = [0]
 
-finally:
-    print('File size: {}'.format(total_size))
-    for key, value in sorted(status_codes_dict.items()):
-        if value != 0:
-            print('{}: {}'.format(key, value))
+    # print the final stats once, however the loop ends
+    atexit.register(lambda: print_stats(total[0], counts))
+
+    try:
+        run(sys.stdin.buffer, counts, total)
+    except KeyboardInterrupt:
+        pass  # CTRL+C ends the loop; the stats are printed at exit